@@ -1,3 +1,4 @@
+import sys
 from typing import Any, Callable, Optional
 from agents import Agent, Runner, RunResult
 from agents.run_context import TContext
@@ -25,7 +26,13 @@ class ResearchAgent(Agent[TContext]):
         # If both are specified, we raise an error - they can't be used together
         if self.output_parser and kwargs.get('output_type'):
             raise ValueError("Cannot specify both output_parser and output_type")
-            
+
+        # Intern string instructions so the many agent instances constructed per
+        # research session (one set per section loop) share a single copy of
+        # each multi-KB prompt instead of duplicating it
+        if isinstance(kwargs.get('instructions'), str):
+            kwargs['instructions'] = sys.intern(kwargs['instructions'])
+
         super().__init__(*args, **kwargs)
     
 
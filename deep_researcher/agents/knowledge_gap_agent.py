@@ -15,6 +15,8 @@ The Agent then:
 3. Returns a KnowledgeGapOutput object
 """
 
+import json
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from typing import List
 from .baseclass import ResearchAgent
@@ -28,8 +30,11 @@ class KnowledgeGapOutput(BaseModel):
     outstanding_gaps: List[str] = Field(description="List of philosophical knowledge gaps that still need to be addressed")
 
 
-INSTRUCTIONS = f"""
-You are a Philosophical Research State Evaluator. Today's date is {datetime.now().strftime("%Y-%m-%d")}.
+@lru_cache(maxsize=4)
+def _build_instructions(current_date: str) -> str:
+    """Build the system prompt, caching it so the Pydantic schema is only generated once per date."""
+    return f"""
+You are a Philosophical Research State Evaluator. Today's date is {current_date}.
 Your job is to critically analyze the current state of philosophical research, 
 identify what knowledge gaps still exist and determine the best next step to take.
 
@@ -70,16 +75,17 @@ Focus on these aspects when identifying gaps:
 Be specific in the gaps you identify and include relevant philosophical context as this will be passed onto another agent to process without additional context.
 
 Only output JSON and follow the JSON schema below. Do not output anything else. I will be parsing this with Pydantic so output valid JSON only:
-{KnowledgeGapOutput.model_json_schema()}
+{json.dumps(KnowledgeGapOutput.model_json_schema(), separators=(",", ":"))}
 """
 
 def init_knowledge_gap_agent(config: LLMConfig) -> ResearchAgent:
     selected_model = config.fast_model
+    supports_structured_output = model_supports_structured_output(selected_model)
 
     return ResearchAgent(
         name="KnowledgeGapAgent",
-        instructions=INSTRUCTIONS,
+        instructions=_build_instructions(datetime.now().strftime("%Y-%m-%d")),
         model=selected_model,
-        output_type=KnowledgeGapOutput if model_supports_structured_output(selected_model) else None,
-        output_parser=create_type_parser(KnowledgeGapOutput) if not model_supports_structured_output(selected_model) else None
+        output_type=KnowledgeGapOutput if supports_structured_output else None,
+        output_parser=create_type_parser(KnowledgeGapOutput) if not supports_structured_output else None
     )
\ No newline at end of file
@@ -12,15 +12,26 @@ The Agent then:
 2. Includes citations and references
 3. Returns a LongWriterOutput object
 """
-from .baseclass import ResearchAgent, ResearchRunner
+import asyncio
+import json
+from functools import lru_cache
+from .baseclass import ResearchAgent
 from ..llm_config import LLMConfig, model_supports_structured_output
 from .utils.parse_output import create_type_parser
+from ..utils.cache import cached_run
 from datetime import datetime
 from pydantic import BaseModel, Field
-from .proofreader_agent import ReportDraft
-from typing import List, Tuple, Dict
+from .proofreader_agent import ReportDraft, ReportDraftSection
+from typing import List, Dict, Optional
 import re
 
+# Precompiled pattern for the per-section reference reformatting below
+_REF_RE = re.compile(r'\[(\d+)\]')
+
+# Sentinels delimiting the markdown body in the LongWriterAgent's output
+MARKDOWN_START = "<<<MARKDOWN>>>"
+MARKDOWN_END = "<<<END>>>"
+
 
 class LongWriterOutput(BaseModel):
     """Output from the Long Writer Agent"""
@@ -28,27 +39,19 @@ class LongWriterOutput(BaseModel):
     references: List[str] = Field(description="List of references used in the section")
 
 
-INSTRUCTIONS = f"""
-You are an expert philosophical writer tasked with writing detailed sections of a philosophical article. 
-Today's date is {datetime.now().strftime('%Y-%m-%d')}.
-You will be provided with:
-1. The original philosophical research query
-2. The article title
-3. A final draft of the article containing all sections written up until this point
-4. A first draft of the next section to be written
+class LongWriterBatchOutput(BaseModel):
+    """Output from the Long Writer Agent when writing multiple sections in one call"""
+    sections: List[LongWriterOutput] = Field(description="The written sections, in the same order as the provided section drafts")
 
-OBJECTIVE:
-1. Write a final draft of the next section that:
-   - Maintains philosophical rigor and accuracy
-   - Presents arguments clearly and logically
-   - Includes proper analysis and interpretation
-   - Connects with the broader philosophical context
-   - Uses appropriate philosophical terminology
-   - Demonstrates deep critical engagement
-   - Integrates modern context and applications
-   - Is suitable for modular app content
-2. Include proper citations and references
 
+# Sections whose first draft is at most this many characters are eligible to be
+# batched together into a single LLM call (up to _MAX_BATCH_SIZE at a time)
+_BATCH_SECTION_CHAR_LIMIT = 4000
+_MAX_BATCH_SIZE = 3
+
+
+# Writing guidelines shared between the single-section and batched prompts
+_SECTION_GUIDELINES = """
 Analytical Depth Requirements:
 - Go beyond surface-level descriptions to provide deep analysis
 - Critically engage with primary sources and interpretations
@@ -107,13 +110,7 @@ Ethical and Societal Analysis:
 
 Citation Guidelines:
 - Include numbered citations in square brackets in the text
-- List all references at the end of the section
-- Follow this example format:
-
-LongWriterOutput(
-    next_section_markdown="The concept of the categorical imperative was first introduced by Kant in his Groundwork of the Metaphysics of Morals [1]. This idea has been interpreted in various ways by contemporary philosophers [2].",
-    references=["[1] https://example.com/kant-groundwork", "[2] https://example.com/contemporary-interpretations"]
-)
+- List all references at the end of the section in the references array
 
 Section Structure Guidelines:
 - Begin with a clear introduction to the section's topic
@@ -143,23 +140,150 @@ Content Guidelines:
 - Challenge assumptions and explore implications
 - Make content suitable for app-based learning
 - Ensure each section can stand alone while maintaining overall coherence
+"""
+
+
+@lru_cache(maxsize=4)
+def _build_instructions(current_date: str) -> str:
+    """Build the system prompt, caching it so it is only constructed once per date."""
+    return f"""
+You are an expert philosophical writer tasked with writing detailed sections of a philosophical article.
+Today's date is {current_date}.
+You will be provided with:
+1. The original philosophical research query
+2. The article title
+3. The current draft of the article, containing the title and table of contents (sections are written concurrently, so their bodies are not included)
+4. A first draft of the next section to be written
 
+OBJECTIVE:
+1. Write a final draft of the next section that:
+   - Maintains philosophical rigor and accuracy
+   - Presents arguments clearly and logically
+   - Includes proper analysis and interpretation
+   - Connects with the broader philosophical context
+   - Uses appropriate philosophical terminology
+   - Demonstrates deep critical engagement
+   - Integrates modern context and applications
+   - Is suitable for modular app content
+2. Include proper citations and references
+{_SECTION_GUIDELINES}
+OUTPUT FORMAT:
+Output the markdown content of the section between a {MARKDOWN_START} line and a {MARKDOWN_END} line, followed by the references as a JSON array of strings. Follow this example format exactly and do not output anything else:
+
+{MARKDOWN_START}
+The concept of the categorical imperative was first introduced by Kant in his Groundwork of the Metaphysics of Morals [1]. This idea has been interpreted in various ways by contemporary philosophers [2].
+{MARKDOWN_END}
+["[1] https://example.com/kant-groundwork", "[2] https://example.com/contemporary-interpretations"]
+"""
+
+
+@lru_cache(maxsize=4)
+def _build_batch_instructions(current_date: str) -> str:
+    """Build the system prompt for the batched variant of the agent, caching it so the Pydantic schema is only generated once per date."""
+    return f"""
+You are an expert philosophical writer tasked with writing detailed sections of a philosophical article.
+Today's date is {current_date}.
+You will be provided with:
+1. The original philosophical research query
+2. The article title
+3. The current draft of the article, containing the title and table of contents (sections are written concurrently, so their bodies are not included)
+4. First drafts of several numbered sections to be written next
+
+OBJECTIVE:
+1. Write a final draft of EACH of the provided sections that:
+   - Maintains philosophical rigor and accuracy
+   - Presents arguments clearly and logically
+   - Includes proper analysis and interpretation
+   - Connects with the broader philosophical context
+   - Uses appropriate philosophical terminology
+   - Demonstrates deep critical engagement
+   - Integrates modern context and applications
+   - Is suitable for modular app content
+2. Include proper citations and references for each section
+3. Return exactly one written section per provided section draft, in the same order
+{_SECTION_GUIDELINES}
 Only output JSON. Follow the JSON schema below. Do not output anything else. I will be parsing this with Pydantic so output valid JSON only:
-{LongWriterOutput.model_json_schema()}
+{json.dumps(LongWriterBatchOutput.model_json_schema(), separators=(",", ":"))}
 """
 
+
+def parse_long_writer_output(output: str) -> LongWriterOutput:
+    """
+    Parse the sentinel-delimited output of the LongWriterAgent.
+
+    The markdown body is emitted between sentinel lines rather than inside a JSON string,
+    which avoids escaping/unescaping every quote and newline of a potentially very large
+    markdown blob - only the small references array is JSON-encoded. Falls back to JSON
+    parsing if the model ignored the sentinel format.
+    """
+    start = output.find(MARKDOWN_START)
+    end = output.find(MARKDOWN_END, start + len(MARKDOWN_START)) if start != -1 else -1
+    if start == -1 or end == -1:
+        # The model ignored the sentinel format - assume it responded with JSON instead
+        return create_type_parser(LongWriterOutput)(output)
+
+    next_section_markdown = output[start + len(MARKDOWN_START):end].strip('\n')
+
+    # Only the references array after the closing sentinel needs JSON parsing
+    references = []
+    remainder = output[end + len(MARKDOWN_END):]
+    array_start, array_end = remainder.find('['), remainder.rfind(']')
+    if array_start != -1 and array_end > array_start:
+        try:
+            references = json.loads(remainder[array_start:array_end + 1])
+        except ValueError:
+            print(f"Invalid references array in LongWriterAgent output: {remainder.strip()}")
+
+    return LongWriterOutput(next_section_markdown=next_section_markdown, references=references)
+
+
 def init_long_writer_agent(config: LLMConfig) -> ResearchAgent:
     selected_model = config.fast_model
 
+    # The agent responds with sentinel-delimited text rather than JSON, so the custom
+    # parser is used regardless of whether the model supports structured output
     return ResearchAgent(
         name="LongWriterAgent",
-        instructions=INSTRUCTIONS,
+        instructions=_build_instructions(datetime.now().strftime('%Y-%m-%d')),
         model=selected_model,
-        output_type=LongWriterOutput if model_supports_structured_output(selected_model) else None,
-        output_parser=create_type_parser(LongWriterOutput) if not model_supports_structured_output(selected_model) else None
+        output_parser=parse_long_writer_output
     )
 
 
+def init_long_writer_batch_agent(config: LLMConfig) -> ResearchAgent:
+    selected_model = config.fast_model
+    supports_structured_output = model_supports_structured_output(selected_model)
+
+    return ResearchAgent(
+        name="LongWriterBatchAgent",
+        instructions=_build_batch_instructions(datetime.now().strftime('%Y-%m-%d')),
+        model=selected_model,
+        output_type=LongWriterBatchOutput if supports_structured_output else None,
+        output_parser=create_type_parser(LongWriterBatchOutput) if not supports_structured_output else None
+    )
+
+
+# Static user-message template, built once at import; the tag structure is identical on
+# every call, which also helps provider-side prompt caches hit on the shared prefix
+_USER_MESSAGE_TEMPLATE = """
+    <ORIGINAL QUERY>
+    {original_query}
+    </ORIGINAL QUERY>
+
+    <CURRENT REPORT DRAFT>
+    {report_draft}
+    </CURRENT REPORT DRAFT>
+
+    <TITLE OF NEXT SECTION TO WRITE>
+    {next_section_title}
+    </TITLE OF NEXT SECTION TO WRITE>
+
+    <DRAFT OF NEXT SECTION>
+    {next_section_draft}
+    </DRAFT OF NEXT SECTION>
+    """
+
+
 async def write_next_section(
     long_writer_agent: ResearchAgent,
     original_query: str,
@@ -169,6 +293,30 @@ async def write_next_section(
 ) -> LongWriterOutput:
     """Write the next section of the report"""
 
+    user_message = _USER_MESSAGE_TEMPLATE.format_map({
+        "original_query": original_query,
+        "report_draft": report_draft or "No draft yet",
+        "next_section_title": next_section_title,
+        "next_section_draft": next_section_draft,
+    })
+
+    return await cached_run(long_writer_agent, user_message, LongWriterOutput)
+
+
+async def write_next_sections_batch(
+    long_writer_batch_agent: ResearchAgent,
+    original_query: str,
+    report_draft: str,
+    sections: List[ReportDraftSection],
+) -> List[LongWriterOutput]:
+    """Write several short sections of the report in a single LLM call"""
+
+    section_tags = "\n\n".join(
+        f"<SECTION {i+1} TITLE>\n{section.section_title}\n</SECTION {i+1} TITLE>\n\n"
+        f"<SECTION {i+1} DRAFT>\n{section.section_content}\n</SECTION {i+1} DRAFT>"
+        for i, section in enumerate(sections)
+    )
+
     user_message = f"""
     <ORIGINAL QUERY>
     {original_query}
@@ -178,21 +326,37 @@ async def write_next_section(
     {report_draft or "No draft yet"}
     </CURRENT REPORT DRAFT>
 
-    <TITLE OF NEXT SECTION TO WRITE>
-    {next_section_title}
-    </TITLE OF NEXT SECTION TO WRITE>
-
-    <DRAFT OF NEXT SECTION>
-    {next_section_draft}
-    </DRAFT OF NEXT SECTION>
+    <SECTIONS TO WRITE>
+    {section_tags}
+    </SECTIONS TO WRITE>
     """
 
-    result = await ResearchRunner.run(
-        long_writer_agent,
-        user_message,
-    )
-
-    return result.final_output_as(LongWriterOutput)
+    result = await cached_run(long_writer_batch_agent, user_message, LongWriterBatchOutput)
+    return result.sections
+
+
+def _group_sections_for_batching(
+    sections: List[ReportDraftSection],
+    char_limit: int = _BATCH_SECTION_CHAR_LIMIT,
+    max_batch_size: int = _MAX_BATCH_SIZE,
+) -> List[List[ReportDraftSection]]:
+    """Group consecutive short sections into batches; long sections get a group of their own"""
+    groups = []
+    current_group = []
+    for section in sections:
+        if len(section.section_content) <= char_limit:
+            current_group.append(section)
+            if len(current_group) == max_batch_size:
+                groups.append(current_group)
+                current_group = []
+        else:
+            if current_group:
+                groups.append(current_group)
+                current_group = []
+            groups.append([section])
+    if current_group:
+        groups.append(current_group)
+    return groups
 
 
 async def write_report(
@@ -200,46 +364,73 @@ async def write_report(
     original_query: str,
     report_title: str,
     report_draft: ReportDraft,
+    long_writer_batch_agent: Optional[ResearchAgent] = None,
 ) -> str:
-    """Write the final report by iteratively writing each section"""
+    """Write the final report by writing each section concurrently and then combining them"""
 
     # Initialize the final draft of the report with the title and table of contents
-    final_draft = f"# {report_title}\n\n" + "## Table of Contents\n\n" + "\n".join([f"{i+1}. {section.section_title}" for i, section in enumerate(report_draft.sections)]) + "\n\n"
-    all_references = []
-
-    for section in report_draft.sections:
-        # Produce the final draft of each section and add it to the report with corresponding references
-        next_section_draft = await write_next_section(long_writer_agent, original_query, final_draft, section.section_title, section.section_content)
-        section_markdown, all_references = reformat_references(
-            next_section_draft.next_section_markdown, 
+    toc_draft = f"# {report_title}\n\n" + "## Table of Contents\n\n" + "\n".join([f"{i+1}. {section.section_title}" for i, section in enumerate(report_draft.sections)]) + "\n\n"
+
+    # If a batch agent is provided, short sections are grouped so that each group shares a
+    # single LLM call, amortizing the per-call prompt and network overhead
+    if long_writer_batch_agent:
+        section_groups = _group_sections_for_batching(report_draft.sections)
+    else:
+        section_groups = [[section] for section in report_draft.sections]
+
+    async def write_group(group: List[ReportDraftSection]) -> List[LongWriterOutput]:
+        if len(group) > 1:
+            outputs = await write_next_sections_batch(long_writer_batch_agent, original_query, toc_draft, group)
+            if len(outputs) == len(group):
+                return outputs
+            # The model returned the wrong number of sections - fall back to per-section calls
+        return await asyncio.gather(*[
+            write_next_section(long_writer_agent, original_query, toc_draft, section.section_title, section.section_content)
+            for section in group
+        ])
+
+    # Each section only needs the title and table of contents for context (not the finalized bodies
+    # of the other sections), so the LLM calls can all run concurrently
+    group_results = await asyncio.gather(*[write_group(group) for group in section_groups])
+    section_drafts = [section_draft for group_result in group_results for section_draft in group_result]
+
+    # Combine the section drafts sequentially so that reference numbering stays deterministic,
+    # collecting the parts in a list so the report is joined in linear time at the end
+    report_parts = [toc_draft]
+    report_ref_map = {}
+
+    for next_section_draft in section_drafts:
+        section_markdown = reformat_references(
+            next_section_draft.next_section_markdown,
             next_section_draft.references,
-            all_references
+            report_ref_map
         )
         section_markdown = reformat_section_headings(section_markdown)
-        final_draft += section_markdown + '\n\n'
+        report_parts.append(section_markdown + '\n\n')
 
-    # Add the final references to the end of the report
-    final_draft += '## References:\n\n' + '  \n'.join(all_references)
-    return final_draft
+    # Add the final references to the end of the report - the map is in insertion
+    # (i.e. reference number) order, so the string list only needs building once here
+    report_parts.append('## References:\n\n' + '  \n'.join(f"[{ref_num}] {url}" for url, ref_num in report_ref_map.items()))
+    return ''.join(report_parts)
 
 
 def reformat_references(
-        section_markdown: str, 
-        section_references: List[str], 
-        all_references: List[str] 
-    ) -> Tuple[str, List[str]]:
+        section_markdown: str,
+        section_references: List[str],
+        report_ref_map: Dict[str, int]
+    ) -> str:
     """
     This method gracefully handles the re-numbering, de-duplication and re-formatting of references as new sections are added to the report draft.
     It takes as input:
     1. The markdown content of the new section containing inline references in square brackets, e.g. [1], [2]
     2. The list of references for the new section, e.g. ["[1] https://example1.com", "[2] https://example2.com"]
-    3. The list of references covering all prior sections of the report
+    3. A map of URL to reference number covering all prior sections of the report, which is updated in place with the new section's references
 
-    It returns:
-    1. The updated markdown content of the new section with the references re-numbered and de-duplicated, such that they increment from the previous references
-    2. The updated list of references for the full report, to include the new section's references
+    It returns the updated markdown content of the new section with the references re-numbered and de-duplicated,
+    such that they increment from the previous references. The report's full reference list can be materialized
+    from the map once all sections have been processed, since the map preserves insertion (numbering) order.
     """
-    def convert_ref_list_to_map(ref_list: List[str]) -> Dict[str, str]:
+    def convert_ref_list_to_map(ref_list: List[str]) -> Dict[str, int]:
         ref_map = {}
         for ref in ref_list:
             try:
@@ -252,19 +443,19 @@ def reformat_references(
         return ref_map
 
     section_ref_map = convert_ref_list_to_map(section_references)
-    report_ref_map = convert_ref_list_to_map(all_references)
     section_to_report_ref_map = {}
 
-    report_urls = set(report_ref_map.keys())
-    ref_count = max(report_ref_map.values() or [0])
+    # Reference numbers are assigned contiguously from 1, so the highest number
+    # issued so far is simply the size of the map - no need to scan its values
+    ref_count = len(report_ref_map)
     for url, section_ref_num in section_ref_map.items():
-        if url in report_urls:
+        if url in report_ref_map:
             section_to_report_ref_map[section_ref_num] = report_ref_map[url]
         else:
             # If the reference is not in the report, add it to the report
             ref_count += 1
             section_to_report_ref_map[section_ref_num] = ref_count
-            all_references.append(f"[{ref_count}] {url}")
+            report_ref_map[url] = ref_count
 
     def replace_reference(match):
         # Extract the reference number from the match
@@ -276,9 +467,7 @@ def reformat_references(
         return ''
     
     # Replace all references in a single pass using a replacement function
-    section_markdown = re.sub(r'\[(\d+)\]', replace_reference, section_markdown)
-
-    return section_markdown, all_references
+    return _REF_RE.sub(replace_reference, section_markdown)
 
 
 def reformat_section_headings(section_markdown: str) -> str:
@@ -299,20 +488,32 @@ def reformat_section_headings(section_markdown: str) -> str:
     if not section_markdown.strip():
         return section_markdown
 
-    # Find the first heading level
-    first_heading_match = re.search(r'^(#+)\s', section_markdown, re.MULTILINE)
-    if not first_heading_match:
+    # A single linear scan both finds the first heading level and rewrites the
+    # headings, avoiding the two regex passes over the full section body
+    lines = section_markdown.splitlines(keepends=True)
+    reformatted_lines = []
+    level_adjustment = None
+
+    for line in lines:
+        rest = line.lstrip('#')
+        heading_level = len(line) - len(rest)
+        # A heading is one or more '#' characters followed by whitespace
+        if heading_level and rest[:1].isspace():
+            if level_adjustment is None:
+                # Rebase all headings so that the first one sits at level 2
+                level_adjustment = 2 - heading_level
+                # If the section is already correctly based there is nothing to
+                # rewrite, so skip the rest of the scan
+                if level_adjustment == 0:
+                    return section_markdown
+            content = rest[1:]
+            if content.rstrip('\r\n'):
+                new_level = max(1, heading_level + level_adjustment)
+                line = '#' * new_level + ' ' + content
+        reformatted_lines.append(line)
+
+    # If there are no headings, return the section as-is
+    if level_adjustment is None:
         return section_markdown
 
-    # Calculate the level adjustment needed
-    first_heading_level = len(first_heading_match.group(1))
-    level_adjustment = 2 - first_heading_level
-
-    def adjust_heading_level(match):
-        hashes = match.group(1)
-        content = match.group(2)
-        new_level = max(2, len(hashes) + level_adjustment)
-        return '#' * new_level + ' ' + content
-
-    # Apply the heading adjustment to all headings in one pass
-    return re.sub(r'^(#+)\s(.+)$', adjust_heading_level, section_markdown, flags=re.MULTILINE)
+    return ''.join(reformatted_lines)
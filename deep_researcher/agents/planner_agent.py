@@ -12,6 +12,8 @@ The Agent then outputs a ReportPlan object, which includes:
 2. An outline of the article that includes a list of section titles and the key questions to be addressed in each section
 """
 
+import json
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from typing import List
 from .baseclass import ResearchAgent
@@ -35,8 +37,11 @@ class ReportPlan(BaseModel):
     sections: List[ReportPlanSection] = Field(description="List of sections that need to be written")
 
 
-INSTRUCTIONS = f"""
-You are a philosophical research manager, managing a team of research agents. Today's date is {datetime.now().strftime("%Y-%m-%d")}.
+@lru_cache(maxsize=4)
+def _build_instructions(current_date: str) -> str:
+    """Build the system prompt, caching it so the Pydantic schema is only generated once per date."""
+    return f"""
+You are a philosophical research manager, managing a team of research agents. Today's date is {current_date}.
 Given a philosophical research query, your job is to produce an initial outline of the article (section titles and key questions),
 as well as some background context. Each section will be assigned to a different researcher in your team who will then
 carry out research on the section.
@@ -102,17 +107,18 @@ Guidelines for Background Context:
 - DO NOT do more than 2 tool calls
 
 Only output JSON. Follow the JSON schema below. Do not output anything else. I will be parsing this with Pydantic so output valid JSON only:
-{ReportPlan.model_json_schema()}
+{json.dumps(ReportPlan.model_json_schema(), separators=(",", ":"))}
 """
 
 def init_planner_agent(config: LLMConfig) -> ResearchAgent:
     selected_model = config.reasoning_model
+    supports_structured_output = model_supports_structured_output(selected_model)
     search_agent = init_search_agent(config)
     crawl_agent = init_crawl_agent(config)
 
     return ResearchAgent(
             name="PlannerAgent",
-            instructions=INSTRUCTIONS,
+            instructions=_build_instructions(datetime.now().strftime("%Y-%m-%d")),
         tools=[
             search_agent.as_tool(
                 tool_name="web_search",
@@ -124,6 +130,6 @@ def init_planner_agent(config: LLMConfig) -> ResearchAgent:
             )
         ],
         model=selected_model,
-        output_type=ReportPlan if model_supports_structured_output(selected_model) else None,
-        output_parser=create_type_parser(ReportPlan) if not model_supports_structured_output(selected_model) else None
+        output_type=ReportPlan if supports_structured_output else None,
+        output_parser=create_type_parser(ReportPlan) if not supports_structured_output else None
     )
@@ -12,6 +12,7 @@ REPORT DRAFT: <stringified ReportDraft object containing all draft sections>
 The Agent then outputs the final markdown for the philosophical article as a string.
 """
 
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from typing import List
 from .baseclass import ResearchAgent
@@ -30,9 +31,12 @@ class ReportDraft(BaseModel):
     sections: List[ReportDraftSection] = Field(description="List of sections that are in the philosophical article")
 
 
-INSTRUCTIONS = f"""
+@lru_cache(maxsize=4)
+def _build_instructions(current_date: str) -> str:
+    """Build the system prompt, caching it so it is only constructed once per date."""
+    return f"""
 You are a philosophical research expert who proofreads and edits philosophical articles.
-Today's date is {datetime.now().strftime("%Y-%m-%d")}.
+Today's date is {current_date}.
 
 You are given:
 1. The original philosophical query topic for the article
@@ -70,6 +74,6 @@ def init_proofreader_agent(config: LLMConfig) -> ResearchAgent:
 
     return ResearchAgent(
         name="ProofreaderAgent",
-        instructions=INSTRUCTIONS,
+        instructions=_build_instructions(datetime.now().strftime("%Y-%m-%d")),
         model=selected_model
     )
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Agent used to fuse the reflection (ThinkingAgent) and research state evaluation
+(KnowledgeGapAgent) steps of the research loop into a single LLM call.
+
+The Agent takes as input a string in the following format:
+===========================================================
+ORIGINAL QUERY: <original user query>
+
+BACKGROUND CONTEXT: <supporting background context related to the original query>
+
+HISTORY OF ACTIONS, FINDINGS AND THOUGHTS: <a log of prior iterations of the research process>
+===========================================================
+
+The Agent then:
+1. Reflects on the research process so far and shares its latest thoughts
+2. Assesses the completeness of the research in addressing the philosophical query
+3. Identifies specific knowledge gaps that still exist and need to be filled
+4. Returns a ReflectAndPlanOutput object
+
+Running both steps in one call removes an LLM round-trip per research iteration
+compared to running the ThinkingAgent and KnowledgeGapAgent separately.
+"""
+
+import json
+from functools import lru_cache
+from pydantic import BaseModel, Field
+from typing import List
+from .baseclass import ResearchAgent
+from ..llm_config import LLMConfig, model_supports_structured_output
+from datetime import datetime
+from .utils.parse_output import create_type_parser
+
+
+class ReflectAndPlanOutput(BaseModel):
+    """Output from the Reflect and Plan Agent"""
+    thoughts: str = Field(description="Latest reflections on the state of the philosophical research process")
+    research_complete: bool = Field(description="Whether the philosophical research and findings are complete enough to end the research loop")
+    outstanding_gaps: List[str] = Field(description="List of philosophical knowledge gaps that still need to be addressed")
+
+
+@lru_cache(maxsize=4)
+def _build_instructions(current_date: str) -> str:
+    """Build the system prompt, caching it so the Pydantic schema is only generated once per date."""
+    return f"""
+You are a philosophical research expert who is managing a research process in iterations. Today's date is {current_date}.
+
+You will be given:
+1. The original philosophical research query along with some supporting background context
+2. A full history of the tasks, actions, findings and thoughts you've made up until this point in the research process (on iteration 1 this will be empty)
+
+Your objective is to do BOTH of the following in a single response:
+1. Reflect on the philosophical research process so far and share your latest thoughts
+2. Critically evaluate the completeness of the research and identify any knowledge gaps that still need to be addressed
+
+For your reflections (the 'thoughts' field):
+- Share your stream of consciousness on the research process as raw text
+- Focus most of your thoughts on the most recent iteration and how that influences this next iteration
+- Consider whether you were able to find authoritative sources and primary texts
+- Look for philosophical tensions, contradictions or missing perspectives
+- If this is the first iteration, provide thoughts on what philosophical information we need to gather to get started
+- DO NOT produce a draft of the final report. This is not your job.
+
+For your evaluation (the 'research_complete' and 'outstanding_gaps' fields):
+1. Carefully review the findings and thoughts, particularly from the latest iteration, and assess their completeness in addressing the philosophical query
+2. Determine if the findings are sufficiently complete to end the research loop
+3. If not, identify up to 3 knowledge gaps that need to be addressed in sequence
+
+Focus on these aspects when identifying gaps:
+- Primary Sources: missing key philosophical texts, incomplete understanding of original arguments, gaps in historical context, missing interpretations
+- Philosophical Analysis: logical gaps in arguments, missing counter-arguments, incomplete critical analysis, unresolved philosophical tensions
+- Historical Context: missing historical background, gaps in philosophical tradition, incomplete understanding of influence, missing connections to other philosophers
+- Contemporary Relevance: missing modern applications, gaps in current interpretations, incomplete understanding of impact, missing contemporary debates
+
+Be specific in the gaps you identify and include relevant philosophical context as this will be passed onto another agent to process without additional context.
+
+Only output JSON. Follow the JSON schema below. Do not output anything else. I will be parsing this with Pydantic so output valid JSON only:
+{json.dumps(ReflectAndPlanOutput.model_json_schema(), separators=(",", ":"))}
+"""
+
+
+def init_reflect_and_plan_agent(config: LLMConfig) -> ResearchAgent:
+    selected_model = config.reasoning_model
+    supports_structured_output = model_supports_structured_output(selected_model)
+
+    return ResearchAgent(
+        name="ReflectAndPlanAgent",
+        instructions=_build_instructions(datetime.now().strftime("%Y-%m-%d")),
+        model=selected_model,
+        output_type=ReflectAndPlanOutput if supports_structured_output else None,
+        output_parser=create_type_parser(ReflectAndPlanOutput) if not supports_structured_output else None
+    )
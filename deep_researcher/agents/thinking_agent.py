@@ -12,12 +12,16 @@ HISTORY OF ACTIONS, FINDINGS AND THOUGHTS: <a log of prior iterations of the res
 
 The Agent then outputs a string containing its latest thoughts on the research process.
 """
+from functools import lru_cache
 from .baseclass import ResearchAgent
 from ..llm_config import LLMConfig
 from datetime import datetime
 
-INSTRUCTIONS = f"""
-You are a philosophical research expert who is managing a research process in iterations. Today's date is {datetime.now().strftime("%Y-%m-%d")}
+@lru_cache(maxsize=4)
+def _build_instructions(current_date: str) -> str:
+    """Build the system prompt, caching it so it is only constructed once per date."""
+    return f"""
+You are a philosophical research expert who is managing a research process in iterations. Today's date is {current_date}
 
 You are given:
 1. The original philosophical research query along with some supporting background context
@@ -53,6 +57,6 @@ def init_thinking_agent(config: LLMConfig) -> ResearchAgent:
 
     return ResearchAgent(
         name="ThinkingAgent",
-        instructions=INSTRUCTIONS,
+        instructions=_build_instructions(datetime.now().strftime("%Y-%m-%d")),
         model=selected_model,
     )
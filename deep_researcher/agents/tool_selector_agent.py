@@ -21,12 +21,28 @@ The available agents are:
 - SiteCrawlerAgent: Crawl philosophical websites, encyclopedias, and academic resources
 """
 
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from ..llm_config import LLMConfig, model_supports_structured_output
 from datetime import datetime
-from .baseclass import ResearchAgent
-from .utils.parse_output import create_type_parser
+from .baseclass import ResearchAgent, ResearchRunner
+from .utils.parse_output import OutputParserError, create_lazy_type_parser
+
+try:
+    # orjson serializes the embedded schema faster and is already compact;
+    # it remains an optional dependency with a stdlib fallback
+    import orjson
+
+    def _dumps_compact(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps_compact(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
 
 
 class AgentTask(BaseModel):
@@ -39,60 +55,251 @@ class AgentTask(BaseModel):
 
 class AgentSelectionPlan(BaseModel):
     """A plan for which agents to use to address knowledge gaps"""
-    tasks: List[AgentTask] = Field(description="List of tasks for agents to execute")
+    tasks: List[AgentTask] = Field(description="List of tasks for agents to execute", max_length=3)
+
+
+# Known agent names, keyed by lowercase so wrong-cased LLM output (e.g.
+# "websearchagent") is corrected locally instead of failing the tool lookup
+_CANONICAL_AGENT_NAMES = {
+    "websearchagent": "WebSearchAgent",
+    "sitecrawleragent": "SiteCrawlerAgent",
+}
+
+
+def _canonicalize_agent_name(name: str) -> str:
+    return _CANONICAL_AGENT_NAMES.get(name.strip().lower(), name)
+
+
+# Minified wire format of AgentTask: single-letter field names shrink both the
+# schema embedded in the prompt and every JSON object the LLM emits, with the
+# field descriptions carrying the semantics. Note that the class docstrings of
+# these wire models are shipped to the LLM as schema descriptions, so they must
+# stay short and model-facing.
+class _AgentTaskMin(BaseModel):
+    """A task for a specific agent to address knowledge gaps"""
+    a: Optional[str] = Field(description="The knowledge gap being addressed", default=None)
+    b: str = Field(description="The name of the agent to use")
+    c: str = Field(description="The specific query for the agent")
+    d: Optional[str] = Field(description="The website of the entity being researched, if known", default=None)
+
+    def expand(self) -> AgentTask:
+        return AgentTask(gap=self.a, agent=_canonicalize_agent_name(self.b), query=self.c, entity_website=self.d)
+
+
+# Minified wire format of AgentSelectionPlan
+class _AgentSelectionPlanMin(BaseModel):
+    """A plan for which agents to use to address knowledge gaps"""
+    t: List[_AgentTaskMin] = Field(description="List of tasks for agents to execute", max_length=3)
+
+    def expand(self) -> AgentSelectionPlan:
+        return AgentSelectionPlan(tasks=[task.expand() for task in self.t])
+
+
+class AgentSelectionBatch(BaseModel):
+    """A batch of agent selection plans, one per knowledge gap"""
+    plans: List[AgentSelectionPlan] = Field(description="One agent selection plan per numbered knowledge gap, in order")
 
 
-INSTRUCTIONS = f"""
-You are a Philosophical Research Tool Selector responsible for determining which specialized agents should address knowledge gaps in philosophical research.
-Today's date is {datetime.now().strftime("%Y-%m-%d")}.
+# Minified wire format of AgentSelectionBatch
+class _AgentSelectionBatchMin(BaseModel):
+    """A batch of agent selection plans, one per knowledge gap"""
+    p: List[_AgentSelectionPlanMin] = Field(description="One agent selection plan per numbered knowledge gap, in order")
 
-You will be given:
-1. The original philosophical research query
-2. A knowledge gap identified in the research
-3. A full history of the tasks, actions, findings and thoughts you've made up until this point in the research process
+    def expand(self) -> AgentSelectionBatch:
+        return AgentSelectionBatch(plans=[plan.expand() for plan in self.p])
 
-Your task is to decide:
-1. Which specialized agents are best suited to address the gap
-2. What specific queries should be given to the agents (keep this short - 3-6 words)
 
+def to_agent_selection_plan(output) -> AgentSelectionPlan:
+    """Expand the tool selector's output to an AgentSelectionPlan if it is still in wire format"""
+    if isinstance(output, _AgentSelectionPlanMin):
+        return output.expand()
+    return output
+
+
+def to_agent_selection_batch(output) -> AgentSelectionBatch:
+    """Expand the batch tool selector's output to an AgentSelectionBatch if it is still in wire format"""
+    if isinstance(output, _AgentSelectionBatchMin):
+        return output.expand()
+    return output
+
+
+# Built lazily: the parsers are only needed for models without structured output
+_parse_min_plan = create_lazy_type_parser(_AgentSelectionPlanMin)
+_parse_min_batch = create_lazy_type_parser(_AgentSelectionBatchMin)
+
+
+def _parse_selection_plan(output: str) -> AgentSelectionPlan:
+    """Parse the minified wire format and expand it to the full AgentSelectionPlan"""
+    return _parse_min_plan(output).expand()
+
+
+def _parse_selection_batch(output: str) -> AgentSelectionBatch:
+    """Parse the minified wire format and expand it to the full AgentSelectionBatch"""
+    return _parse_min_batch(output).expand()
+
+
+# Agent catalogue and guidelines shared by the single-gap and batch prompts
+_AGENT_CATALOGUE_AND_GUIDELINES = """
 Available specialized agents:
-- WebSearchAgent: Search for philosophical information from authoritative sources such as:
-  * Stanford Encyclopedia of Philosophy
-  * Internet Encyclopedia of Philosophy
-  * Academic philosophy journals
-  * Primary philosophical texts
-  * Philosophical dictionaries and reference works
-- SiteCrawlerAgent: Crawl specific philosophical websites and resources to gather detailed information about:
-  * Primary sources
-  * Philosophical arguments
-  * Historical context
-  * Critical interpretations
-  * Contemporary applications
+- WebSearchAgent: searches authoritative philosophical sources (Stanford/Internet Encyclopedia of Philosophy, academic journals, primary texts, dictionaries and reference works)
+- SiteCrawlerAgent: crawls a specific philosophical website for primary sources, arguments, historical context, critical interpretations and contemporary applications
 
 Guidelines:
-- Prioritize authoritative philosophical sources
-- Focus on primary sources and academic interpretations
-- Consider both historical and contemporary perspectives
-- Ensure balanced coverage of different philosophical viewpoints
-- Include critical analysis and counter-arguments
-- Aim to call at most 3 agents at a time in your final output
-- You can list the WebSearchAgent multiple times with different queries if needed to cover the full scope of the knowledge gap
-- Be specific and concise (3-6 words) with the agent queries - they should target exactly what information is needed
-- If you know the website of a specific philosophical resource, always include it in the query
-- If a gap doesn't clearly match any agent's capability, default to the WebSearchAgent
-- Use the history of actions / tool calls as a guide - try not to repeat yourself if an approach didn't work previously
+1. Call at most 3 agents; the same agent can appear multiple times with different queries to cover the full scope of the gap
+2. Keep agent queries specific and concise (3-6 words), targeting exactly what information is needed
+3. Prioritize authoritative and primary sources, balancing historical and contemporary perspectives, critical analysis and counter-arguments
+4. If you know the website of a specific philosophical resource, include it; if no agent clearly fits the gap, default to WebSearchAgent
+5. Use the history as a guide - try not to repeat an approach that didn't work previously
+"""
+
 
+@lru_cache(maxsize=4)
+def _build_instructions(current_date: str, include_schema: bool) -> str:
+    """
+    Build the system prompt, caching it so the Pydantic schema is only generated once per date.
+
+    The JSON schema is only embedded when the model can't receive it out-of-band
+    via structured output - otherwise it would be duplicate tokens on every call.
+    """
+    schema_block = f"""
 Only output JSON. Follow the JSON schema below. Do not output anything else. I will be parsing this with Pydantic so output valid JSON only:
-{AgentSelectionPlan.model_json_schema()}
-"""
+{_dumps_compact(_AgentSelectionPlanMin.model_json_schema())}
+""" if include_schema else ""
+    return f"""
+You are a Philosophical Research Tool Selector: given the original philosophical research query, a knowledge gap identified in the research, and the history of actions, findings and thoughts so far, decide which specialized agents should address the gap and what query to give each. Today's date is {current_date}.
+{_AGENT_CATALOGUE_AND_GUIDELINES}{schema_block}"""
+
+
+@lru_cache(maxsize=4)
+def _build_batch_instructions(current_date: str, include_schema: bool) -> str:
+    """Build the system prompt for the batch variant that handles several numbered gaps in one call."""
+    schema_block = f"""
+Only output JSON. Follow the JSON schema below. Do not output anything else. I will be parsing this with Pydantic so output valid JSON only:
+{_dumps_compact(_AgentSelectionBatchMin.model_json_schema())}
+""" if include_schema else ""
+    return f"""
+You are a Philosophical Research Tool Selector: given the original philosophical research query, a numbered list of knowledge gaps identified in the research, and the history of actions, findings and thoughts so far, decide which specialized agents should address each gap and what query to give each. Today's date is {current_date}.
+{_AGENT_CATALOGUE_AND_GUIDELINES}
+Return one plan per numbered gap, in the same order as the gaps.
+{schema_block}"""
+
+# In-memory cache of routing decisions. The selector repeatedly sees
+# near-identical (ORIGINAL QUERY, KNOWLEDGE GAP) pairs across iterations and
+# runs, and the routing for a repeat pair is stable, so a cache hit skips the
+# LLM round-trip entirely.
+_SELECTION_CACHE: "OrderedDict[str, AgentSelectionPlan]" = OrderedDict()
+_SELECTION_CACHE_MAX_SIZE = 1024
+
+_HISTORY_MARKER = "HISTORY OF ACTIONS"
+
+
+def _normalize_selector_input(input_str: str) -> str:
+    """
+    Normalize the selector input for cache keying: drop the history section
+    (volatile and low-signal for routing), lowercase and collapse whitespace.
+    """
+    history_start = input_str.find(_HISTORY_MARKER)
+    if history_start != -1:
+        input_str = input_str[:history_start]
+    return " ".join(input_str.lower().split())
+
+
+def _selection_cache_key(agent: ResearchAgent, input_str: str) -> str:
+    model_name = str(getattr(agent.model, "model", agent.model))
+    payload = f"{model_name}\x1e{_normalize_selector_input(input_str)}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def select_agents(tool_selector_agent: ResearchAgent, input_str: str) -> AgentSelectionPlan:
+    """
+    Run the tool selector and return the expanded AgentSelectionPlan, serving
+    repeat (query, gap) pairs from the in-memory routing cache.
+    """
+    key = _selection_cache_key(tool_selector_agent, input_str)
+    cached_plan = _SELECTION_CACHE.get(key)
+    if cached_plan is not None:
+        _SELECTION_CACHE.move_to_end(key)
+        return cached_plan.model_copy(deep=True)
+
+    result = await ResearchRunner.run(tool_selector_agent, input_str)
+    selection_plan = to_agent_selection_plan(result.final_output)
+
+    _SELECTION_CACHE[key] = selection_plan.model_copy(deep=True)
+    if len(_SELECTION_CACHE) > _SELECTION_CACHE_MAX_SIZE:
+        _SELECTION_CACHE.popitem(last=False)
+
+    return selection_plan
+
+
+async def select_for_gaps(
+    tool_selector_batch_agent: ResearchAgent,
+    gaps: List[str],
+    query: str,
+    background_context: str = "",
+    history: str = ""
+) -> List[AgentSelectionPlan]:
+    """
+    Select agents for several knowledge gaps in a single LLM call, returning one
+    AgentSelectionPlan per gap in order. N gaps cost one round-trip and one
+    prompt prefill instead of N; if the model returns the wrong number of plans,
+    the gaps are retried individually.
+    """
+    background = f"BACKGROUND CONTEXT:\n{background_context}" if background_context else ""
+    numbered_gaps = "\n".join(f"GAP {i + 1}: {gap}" for i, gap in enumerate(gaps))
+
+    input_str = f"""
+    ORIGINAL QUERY:
+    {query}
+
+    KNOWLEDGE GAPS TO ADDRESS:
+    {numbered_gaps}
+
+    {background}
+
+    HISTORY OF ACTIONS, FINDINGS AND THOUGHTS:
+    {history or "No previous actions, findings or thoughts available."}
+    """
+
+    result = await ResearchRunner.run(tool_selector_batch_agent, input_str)
+    batch = to_agent_selection_batch(result.final_output)
+
+    if len(batch.plans) == len(gaps):
+        return batch.plans
+    if len(gaps) == 1:
+        if batch.plans:
+            return [batch.plans[0]]
+        raise OutputParserError("Batch tool selector returned no plan for the knowledge gap", str(result.final_output))
+
+    # The model didn't return one plan per gap; fall back to selecting per gap
+    single_plans = await asyncio.gather(
+        *(select_for_gaps(tool_selector_batch_agent, [gap], query, background_context, history) for gap in gaps)
+    )
+    return [plans[0] for plans in single_plans]
+
 
 def init_tool_selector_agent(config: LLMConfig) -> ResearchAgent:
-    selected_model = config.reasoning_model
+    # Tool selection is a narrow classification task, so it runs on the
+    # lighter router model rather than the reasoning model
+    selected_model = config.router_model
+    supports_structured_output = model_supports_structured_output(selected_model)
 
     return ResearchAgent(
         name="ToolSelectorAgent",
-        instructions=INSTRUCTIONS,
+        instructions=_build_instructions(datetime.now().strftime("%Y-%m-%d"), include_schema=not supports_structured_output),
+        model=selected_model,
+        output_type=_AgentSelectionPlanMin if supports_structured_output else None,
+        output_parser=_parse_selection_plan if not supports_structured_output else None
+    )
+
+
+def init_tool_selector_batch_agent(config: LLMConfig) -> ResearchAgent:
+    selected_model = config.router_model
+    supports_structured_output = model_supports_structured_output(selected_model)
+
+    return ResearchAgent(
+        name="ToolSelectorBatchAgent",
+        instructions=_build_batch_instructions(datetime.now().strftime("%Y-%m-%d"), include_schema=not supports_structured_output),
         model=selected_model,
-        output_type=AgentSelectionPlan if model_supports_structured_output(selected_model) else None,
-        output_parser=create_type_parser(AgentSelectionPlan) if not model_supports_structured_output(selected_model) else None
+        output_type=_AgentSelectionBatchMin if supports_structured_output else None,
+        output_parser=_parse_selection_batch if not supports_structured_output else None
     )
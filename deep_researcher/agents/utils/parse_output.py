@@ -1,6 +1,15 @@
 import json
-from pydantic import BaseModel
-from typing import Any, Callable
+import re
+from pydantic import BaseModel, TypeAdapter
+from typing import Any, Callable, Union, get_args, get_origin
+
+try:
+    # orjson parses medium-to-large payloads (e.g. article sections) several times
+    # faster than the stdlib parser, but remains an optional dependency
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 
 class OutputParserError(Exception):
@@ -45,43 +54,202 @@ def find_json_in_string(string: str) -> str:
     return ""
 
 
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+
+
+def _strip_comments(string: str) -> str:
+    """Remove // and /* */ comments, leaving string literals (e.g. URLs) intact"""
+    result = []
+    in_string = False
+    i = 0
+    n = len(string)
+    while i < n:
+        c = string[i]
+        if in_string:
+            result.append(c)
+            if c == '\\' and i + 1 < n:
+                result.append(string[i + 1])
+                i += 2
+                continue
+            if c == '"':
+                in_string = False
+            i += 1
+        elif c == '"':
+            in_string = True
+            result.append(c)
+            i += 1
+        elif c == '/' and string[i + 1:i + 2] == '/':
+            while i < n and string[i] != '\n':
+                i += 1
+        elif c == '/' and string[i + 1:i + 2] == '*':
+            i += 2
+            while i < n - 1 and not (string[i] == '*' and string[i + 1] == '/'):
+                i += 1
+            i += 2
+        else:
+            result.append(c)
+            i += 1
+    return ''.join(result)
+
+
+def _strip_trailing_commas(string: str) -> str:
+    """Remove commas directly preceding a closing brace/bracket, outside string literals"""
+    result = []
+    in_string = False
+    i = 0
+    n = len(string)
+    while i < n:
+        c = string[i]
+        if in_string:
+            result.append(c)
+            if c == '\\' and i + 1 < n:
+                result.append(string[i + 1])
+                i += 2
+                continue
+            if c == '"':
+                in_string = False
+            i += 1
+        elif c == '"':
+            in_string = True
+            result.append(c)
+            i += 1
+        elif c == ',':
+            j = i + 1
+            while j < n and string[j].isspace():
+                j += 1
+            if j < n and string[j] in '}]':
+                i += 1  # Drop the trailing comma
+            else:
+                result.append(c)
+                i += 1
+        else:
+            result.append(c)
+            i += 1
+    return ''.join(result)
+
+
+def _strip_json_noise(string: str) -> str:
+    """
+    Remove noise that LLMs commonly add to otherwise-valid JSON: // and /* */
+    comments and trailing commas before a closing brace/bracket. Comments come
+    off first so a trailing comma hidden behind one is still caught.
+    """
+    return _strip_trailing_commas(_strip_comments(string))
+
+
+def _try_parse(candidate: str) -> Any:
+    """Parse a candidate as JSON, retrying once with comment/comma noise stripped"""
+    try:
+        return _loads(candidate)
+    except ValueError:
+        return _loads(_strip_json_noise(candidate))
+
+
 def parse_json_output(output: str) -> Any:
-    """Take a string output and parse it as JSON"""
+    """
+    Take a string output and parse it as JSON.
+
+    Common LLM formatting mistakes (markdown code fences, comments, trailing
+    commas) are coerced away locally, so a malformed-but-salvageable output is
+    fixed in microseconds here rather than by re-running the LLM call.
+    """
     # First try to load the string as JSON
     try:
-        return json.loads(output)
-    except json.JSONDecodeError as e:
+        return _try_parse(output)
+    except ValueError:
         pass
 
-    # If that fails, assume that the output is in a code block - remove the code block markers and try again
-    parsed_output = output
-    parsed_output = parsed_output.split("```")[1]
-    parsed_output = parsed_output.split("```")[0]
-    if parsed_output.startswith("json") or parsed_output.startswith("JSON"):
-        parsed_output = parsed_output[4:].strip()
-    try:
-        return json.loads(parsed_output)
-    except json.JSONDecodeError:
-        pass
+    # If that fails, look for a fenced code block and parse its contents
+    fenced = _FENCE_RE.search(output)
+    if fenced:
+        try:
+            return _try_parse(fenced.group(1))
+        except ValueError:
+            pass
 
     # As a last attempt, try to manually find the JSON object in the output and parse it
     parsed_output = find_json_in_string(output)
     if parsed_output:
         try:
-            return json.loads(parsed_output)
-        except json.JSONDecodeError:
+            return _try_parse(parsed_output)
+        except ValueError:
             raise OutputParserError(f"Failed to parse output as JSON", output)
 
     # If all fails, raise an error
     raise OutputParserError(f"Failed to parse output as JSON", output)
 
 
-def create_type_parser(type: BaseModel) -> Callable[[str], BaseModel]:
-    """Create a function that takes a string output and parses it as a specified Pydantic model"""
+def _construct_value(annotation, value: Any) -> Any:
+    """Construct a single value according to its field annotation, recursing into containers"""
+    origin = get_origin(annotation)
+    if origin is Union:
+        # For Optional[X] (the only union the agent models use), construct
+        # against the non-None arm; anything more ambiguous is left as-is
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1 and value is not None:
+            return _construct_value(args[0], value)
+        return value
+    if origin is list and isinstance(value, list):
+        item_annotation = (get_args(annotation) or (Any,))[0]
+        return [_construct_value(item_annotation, item) for item in value]
+    if origin is dict and isinstance(value, dict):
+        value_annotation = (get_args(annotation) or (Any, Any))[1]
+        return {key: _construct_value(value_annotation, item) for key, item in value.items()}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, dict):
+        return _construct_recursive(annotation, value)
+    return value
+
+
+def _construct_recursive(type: BaseModel, output_dict: dict) -> BaseModel:
+    """
+    Build a model with model_construct, recursing into nested models so that
+    e.g. a list-of-submodels field is constructed as submodel instances rather
+    than left as raw dicts (which model_construct alone would do).
+    """
+    fields = type.model_fields
+    values = {}
+    for name, value in output_dict.items():
+        field = fields.get(name)
+        values[name] = _construct_value(field.annotation, value) if field else value
+    return type.model_construct(**values)
+
+
+def create_type_parser(type: BaseModel, trust_schema: bool = False) -> Callable[[str], BaseModel]:
+    """
+    Create a function that takes a string output and parses it as a specified Pydantic model.
+
+    If trust_schema is True, the output is assumed to already conform to the model's schema
+    (e.g. because the provider enforced it server-side) and the parsed dict is loaded with
+    model_construct, which skips validation and is considerably faster for large outputs.
+    Leave it False for untrusted outputs.
+    """
+    # Compile the validator once at parser creation so every parse call goes
+    # straight to the pydantic-core validator instead of back through the class
+    adapter = None if trust_schema else TypeAdapter(type)
 
     def convert_json_string_to_type(output: str) -> BaseModel:
         """Take a string output and parse it as a Pydantic model"""
         output_dict = parse_json_output(output)
-        return type.model_validate(output_dict)
+        if trust_schema:
+            return _construct_recursive(type, output_dict)
+        return adapter.validate_python(output_dict)
 
     return convert_json_string_to_type
+
+
+def create_lazy_type_parser(type: BaseModel, trust_schema: bool = False) -> Callable[[str], BaseModel]:
+    """
+    Like create_type_parser, but defers building the underlying parser until the
+    first output is actually parsed. Useful when the parser is wired up as a
+    fallback that never fires on the happy path (e.g. structured-output-capable
+    models), so its construction cost is only paid when needed.
+    """
+    parser = None
+
+    def parse(output: str) -> BaseModel:
+        nonlocal parser
+        if parser is None:
+            parser = create_type_parser(type, trust_schema)
+        return parser(output)
+
+    return parse
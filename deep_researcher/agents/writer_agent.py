@@ -13,13 +13,23 @@ The Agent then:
 2. Includes proper citations for sources in the format [1], [2], etc.
 3. Returns a string containing the markdown formatted article
 """
+from functools import lru_cache
 from .baseclass import ResearchAgent
 from ..llm_config import LLMConfig
 from datetime import datetime
 
-INSTRUCTIONS = f"""
-You are a senior philosophical researcher tasked with comprehensively addressing a philosophical query. 
-Today's date is {datetime.now().strftime('%Y-%m-%d')}
+
+@lru_cache(maxsize=4)
+def _build_instructions(current_date: str) -> str:
+    """
+    Build the system prompt, cached so the date refreshes per day rather than freezing at import time.
+
+    The date is appended at the end so the large static block forms a byte-stable
+    prefix, which lets providers that cache prompt prefixes server-side reuse the
+    prefill for it across calls and across days.
+    """
+    return f"""
+You are a senior philosophical researcher tasked with comprehensively addressing a philosophical query.
 You will be provided with the original query along with research findings put together by a research assistant.
 Your objective is to generate a final philosophical article in markdown format that demonstrates deep analysis and critical engagement.
 
@@ -114,6 +124,8 @@ Additional Guidelines:
 - Challenge assumptions and explore implications
 - Make content suitable for app-based learning
 - Ensure each section can stand alone while maintaining overall coherence
+
+Today's date is {current_date}
 """
 
 def init_writer_agent(config: LLMConfig) -> ResearchAgent:
@@ -121,6 +133,6 @@ def init_writer_agent(config: LLMConfig) -> ResearchAgent:
 
     return ResearchAgent(
         name="WriterAgent",
-        instructions=INSTRUCTIONS,
+        instructions=_build_instructions(datetime.now().strftime("%Y-%m-%d")),
         model=selected_model,
     )
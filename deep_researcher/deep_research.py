@@ -3,11 +3,11 @@ import time
 from .iterative_research import IterativeResearcher
 from .agents.planner_agent import init_planner_agent, ReportPlan, ReportPlanSection
 from .agents.proofreader_agent import ReportDraftSection, ReportDraft, init_proofreader_agent
-from .agents.long_writer_agent import init_long_writer_agent, write_report
-from .agents.baseclass import ResearchRunner
+from .agents.long_writer_agent import init_long_writer_agent, init_long_writer_batch_agent, write_report
 from typing import List, Optional
 from agents.tracing import trace, gen_trace_id, custom_span
 from .llm_config import LLMConfig, create_default_config
+from .utils.cache import cached_run, checkpointed_run
 
 
 class DeepResearcher:
@@ -30,6 +30,7 @@ class DeepResearcher:
         self.planner_agent = init_planner_agent(self.config)
         self.proofreader_agent = init_proofreader_agent(self.config)
         self.long_writer_agent = init_long_writer_agent(self.config)
+        self.long_writer_batch_agent = init_long_writer_batch_agent(self.config)
 
     async def run(self, query: str) -> str:
         """Run the deep research workflow"""
@@ -66,11 +67,7 @@ class DeepResearcher:
 
         self._log_message("=== Building Report Plan ===")
         user_message = f"QUERY: {query}"
-        result = await ResearchRunner.run(
-            self.planner_agent,
-            user_message
-        )
-        report_plan = result.final_output_as(ReportPlan)
+        report_plan = await checkpointed_run(self.planner_agent, user_message, ReportPlan)
 
         if self.verbose:
             num_sections = len(report_plan.sections)
@@ -151,15 +148,17 @@ class DeepResearcher:
         self._log_message("\n=== Building Final Report ===")
 
         if use_long_writer:
-            final_output = await write_report(self.long_writer_agent, query, report_plan.article_title, report_draft)
+            final_output = await write_report(
+                self.long_writer_agent,
+                query,
+                report_plan.article_title,
+                report_draft,
+                long_writer_batch_agent=self.long_writer_batch_agent
+            )
         else:
             user_prompt = f"QUERY:\n{query}\n\nREPORT DRAFT:\n{report_draft.model_dump_json()}"
             # Run the proofreader agent to produce the final report
-            final_report = await ResearchRunner.run(
-                self.proofreader_agent,
-                user_prompt
-            )
-            final_output = final_report.final_output
+            final_output = await cached_run(self.proofreader_agent, user_prompt)
 
         self._log_message(f"Final report completed")
 
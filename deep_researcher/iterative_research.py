@@ -6,11 +6,13 @@ from agents import custom_span, gen_trace_id, trace
 from .agents.baseclass import ResearchRunner
 from .agents.writer_agent import init_writer_agent
 from .agents.knowledge_gap_agent import KnowledgeGapOutput, init_knowledge_gap_agent
-from .agents.tool_selector_agent import AgentTask, AgentSelectionPlan, init_tool_selector_agent
+from .agents.tool_selector_agent import AgentTask, AgentSelectionPlan, init_tool_selector_agent, select_agents
 from .agents.thinking_agent import init_thinking_agent
+from .agents.reflect_and_plan_agent import ReflectAndPlanOutput, init_reflect_and_plan_agent
 from .agents.tool_agents import init_tool_agents, ToolAgentOutput
 from pydantic import BaseModel, Field
 from .llm_config import LLMConfig, create_default_config
+from .utils.cache import cached_run, checkpointed_run
 
 
 class IterationData(BaseModel):
@@ -57,21 +59,45 @@ class Conversation(BaseModel):
     def get_all_findings(self) -> List[str]:
         return [finding for iteration_data in self.history for finding in iteration_data.findings]
 
+    def compile_iteration(self, iteration_num: int) -> str:
+        """Compile a single iteration of the conversation history into a string."""
+        iteration_data = self.history[iteration_num]
+        compiled = f"[ITERATION {iteration_num + 1}]\n\n"
+        if iteration_data.thought:
+            compiled += f"{self.get_thought_string(iteration_num)}\n\n"
+        if iteration_data.gap:
+            compiled += f"{self.get_task_string(iteration_num)}\n\n"
+        if iteration_data.tool_calls:
+            compiled += f"{self.get_action_string(iteration_num)}\n\n"
+        if iteration_data.findings:
+            compiled += f"{self.get_findings_string(iteration_num)}\n\n"
+        return compiled
+
     def compile_conversation_history(self) -> str:
         """Compile the conversation history into a string."""
-        conversation = ""
-        for iteration_num, iteration_data in enumerate(self.history):
-            conversation += f"[ITERATION {iteration_num + 1}]\n\n"
-            if iteration_data.thought:
-                conversation += f"{self.get_thought_string(iteration_num)}\n\n"
-            if iteration_data.gap:
-                conversation += f"{self.get_task_string(iteration_num)}\n\n"
-            if iteration_data.tool_calls:
-                conversation += f"{self.get_action_string(iteration_num)}\n\n"
-            if iteration_data.findings:
-                conversation += f"{self.get_findings_string(iteration_num)}\n\n"
-
-        return conversation
+        return "".join(self.compile_iteration(iteration_num) for iteration_num in range(len(self.history)))
+
+    def compile_recent_history(self, window: int = 5) -> str:
+        """
+        Compile the conversation history with only the last `window` iterations in
+        full, prefixed by a one-line summary of the older ones. Keeps prompts that
+        only need recent context (e.g. tool selection) at a bounded size instead of
+        growing linearly with the iteration count.
+        """
+        if len(self.history) <= window:
+            return self.compile_conversation_history()
+
+        older = self.history[:-window]
+        older_gaps = "; ".join(iteration_data.gap for iteration_data in older if iteration_data.gap)
+        total_tool_calls = sum(len(iteration_data.tool_calls) for iteration_data in older)
+        summary = (
+            f"[SUMMARY OF ITERATIONS 1-{len(older)}] Made {total_tool_calls} tool calls "
+            f"addressing these knowledge gaps: {older_gaps or 'none recorded'}\n\n"
+        )
+        recent = "".join(
+            self.compile_iteration(iteration_num) for iteration_num in range(len(older), len(self.history))
+        )
+        return summary + recent
     
     def get_task_string(self, iteration_num: int) -> str:
         """Get the task for the current iteration."""
@@ -128,6 +154,7 @@ class IterativeResearcher:
         max_time_minutes: int = 10,
         verbose: bool = True,
         tracing: bool = False,
+        fuse_reflection: bool = True,
         config: Optional[LLMConfig] = None
     ):
         self.max_iterations: int = max_iterations
@@ -138,7 +165,9 @@ class IterativeResearcher:
         self.should_continue: bool = True
         self.verbose: bool = verbose
         self.tracing: bool = tracing
+        self.fuse_reflection: bool = fuse_reflection
         self.config: LLMConfig = create_default_config() if not config else config
+        self.reflect_and_plan_agent = init_reflect_and_plan_agent(self.config)
         self.knowledge_gap_agent = init_knowledge_gap_agent(self.config)
         self.tool_selector_agent = init_tool_selector_agent(self.config)
         self.thinking_agent = init_thinking_agent(self.config)
@@ -171,11 +200,15 @@ class IterativeResearcher:
             # Set up blank IterationData for this iteration
             self.conversation.add_iteration()
 
-            # 1. Generate observations
-            observations: str = await self._generate_observations(query, background_context=background_context)
+            if self.fuse_reflection:
+                # 1+2. Generate observations and evaluate current gaps in a single LLM call
+                evaluation: KnowledgeGapOutput = await self._reflect_and_evaluate(query, background_context=background_context)
+            else:
+                # 1. Generate observations
+                observations: str = await self._generate_observations(query, background_context=background_context)
 
-            # 2. Evaluate current gaps in the research
-            evaluation: KnowledgeGapOutput = await self._evaluate_gaps(query, background_context=background_context)
+                # 2. Evaluate current gaps in the research
+                evaluation: KnowledgeGapOutput = await self._evaluate_gaps(query, background_context=background_context)
             
             # Check if we should continue or break the loop
             if not evaluation.research_complete:
@@ -216,8 +249,48 @@ class IterativeResearcher:
         
         return True
     
+    async def _reflect_and_evaluate(
+        self,
+        query: str,
+        background_context: str = ""
+    ) -> KnowledgeGapOutput:
+        """Generate observations and evaluate knowledge gaps in one fused LLM call."""
+
+        background = f"BACKGROUND CONTEXT:\n{background_context}" if background_context else ""
+
+        input_str = f"""
+        Current Iteration Number: {self.iteration}
+        Time Elapsed: {(time.time() - self.start_time) / 60:.2f} minutes of maximum {self.max_time_minutes} minutes
+
+        ORIGINAL QUERY:
+        {query}
+
+        {background}
+
+        HISTORY OF ACTIONS, FINDINGS AND THOUGHTS:
+        {self.conversation.compile_conversation_history() or "No previous actions, findings or thoughts available."}
+        """
+
+        output = await checkpointed_run(self.reflect_and_plan_agent, input_str, ReflectAndPlanOutput)
+
+        # Add the observations to the conversation
+        self.conversation.set_latest_thought(output.thoughts)
+        self._log_message(self.conversation.latest_thought_string())
+
+        evaluation = KnowledgeGapOutput(
+            research_complete=output.research_complete,
+            outstanding_gaps=output.outstanding_gaps
+        )
+
+        if not evaluation.research_complete:
+            next_gap = evaluation.outstanding_gaps[0]
+            self.conversation.set_latest_gap(next_gap)
+            self._log_message(self.conversation.latest_task_string())
+
+        return evaluation
+
     async def _evaluate_gaps(
-        self, 
+        self,
         query: str,
         background_context: str = ""
     ) -> KnowledgeGapOutput:
@@ -238,12 +311,7 @@ class IterativeResearcher:
         {self.conversation.compile_conversation_history() or "No previous actions, findings or thoughts available."}        
         """
 
-        result = await ResearchRunner.run(
-            self.knowledge_gap_agent,
-            input_str,
-        )
-        
-        evaluation = result.final_output_as(KnowledgeGapOutput)
+        evaluation = await checkpointed_run(self.knowledge_gap_agent, input_str, KnowledgeGapOutput)
 
         if not evaluation.research_complete:
             next_gap = evaluation.outstanding_gaps[0]
@@ -272,15 +340,10 @@ class IterativeResearcher:
         {background}
 
         HISTORY OF ACTIONS, FINDINGS AND THOUGHTS:
-        {self.conversation.compile_conversation_history() or "No previous actions, findings or thoughts available."}
+        {self.conversation.compile_recent_history() or "No previous actions, findings or thoughts available."}
         """
         
-        result = await ResearchRunner.run(
-            self.tool_selector_agent,
-            input_str,
-        )
-        
-        selection_plan = result.final_output_as(AgentSelectionPlan)
+        selection_plan = await select_agents(self.tool_selector_agent, input_str)
 
         # Add the tool calls to the conversation
         self.conversation.set_latest_tool_calls([
@@ -357,13 +420,9 @@ class IterativeResearcher:
         HISTORY OF ACTIONS, FINDINGS AND THOUGHTS:
         {self.conversation.compile_conversation_history() or "No previous actions, findings or thoughts available."}
         """
-        result = await ResearchRunner.run(
-            self.thinking_agent,
-            input_str,
-        )
+        observations = await checkpointed_run(self.thinking_agent, input_str)
 
         # Add the observations to the conversation
-        observations = result.final_output
         self.conversation.set_latest_thought(observations)
         self._log_message(self.conversation.latest_thought_string())
         return observations
@@ -392,14 +451,11 @@ class IterativeResearcher:
         {all_findings}
         """
 
-        result = await ResearchRunner.run(
-            self.writer_agent,
-            input_str,
-        )
-        
+        report = await cached_run(self.writer_agent, input_str)
+
         self._log_message("Final response from IterativeResearcher created successfully")
-        
-        return result.final_output
+
+        return report
     
     def _log_message(self, message: str) -> None:
         """Log a message if verbose is True"""
@@ -1,4 +1,5 @@
-from typing import Union
+from functools import lru_cache
+from typing import Optional, Union
 from openai import AsyncOpenAI, AsyncAzureOpenAI
 from agents import OpenAIChatCompletionsModel, OpenAIResponsesModel, set_tracing_export_api_key, set_tracing_disabled
 from dotenv import load_dotenv
@@ -25,6 +26,8 @@ MAIN_MODEL_PROVIDER = get_env_with_prefix("MAIN_MODEL_PROVIDER", "openai")
 MAIN_MODEL = get_env_with_prefix("MAIN_MODEL", "gpt-4o")
 FAST_MODEL_PROVIDER = get_env_with_prefix("FAST_MODEL_PROVIDER", "openai")
 FAST_MODEL = get_env_with_prefix("FAST_MODEL", "gpt-4o-mini")
+ROUTER_MODEL_PROVIDER = get_env_with_prefix("ROUTER_MODEL_PROVIDER", FAST_MODEL_PROVIDER)
+ROUTER_MODEL = get_env_with_prefix("ROUTER_MODEL", FAST_MODEL)
 
 SEARCH_PROVIDER = get_env_with_prefix("SEARCH_PROVIDER", "serper")
 
@@ -107,15 +110,24 @@ class LLMConfig:
         main_model: str,
         fast_model_provider: str,
         fast_model: str,
+        router_model_provider: Optional[str] = None,
+        router_model: Optional[str] = None,
     ):
         self.search_provider = search_provider
 
+        # The router model handles lightweight classification/routing calls
+        # (e.g. tool selection) and defaults to the fast model settings
+        router_model_provider = router_model_provider or fast_model_provider
+        router_model = router_model or fast_model
+
         if reasoning_model_provider not in supported_providers:
             raise ValueError(f"Invalid model provider: {reasoning_model_provider}")
         if main_model_provider not in supported_providers:
             raise ValueError(f"Invalid model provider: {main_model_provider}")
         if fast_model_provider not in supported_providers:
             raise ValueError(f"Invalid model provider: {fast_model_provider}")
+        if router_model_provider not in supported_providers:
+            raise ValueError(f"Invalid model provider: {router_model_provider}")
 
         # Helper to init any provider model
         def _init_model(provider_key: str, model_name: str):
@@ -128,6 +140,7 @@ class LLMConfig:
         self.reasoning_model = _init_model(reasoning_model_provider, reasoning_model)
         self.main_model = _init_model(main_model_provider, main_model)
         self.fast_model = _init_model(fast_model_provider, fast_model)
+        self.router_model = _init_model(router_model_provider, router_model)
 
 
 def create_default_config() -> LLMConfig:
@@ -139,6 +152,8 @@ def create_default_config() -> LLMConfig:
         main_model=MAIN_MODEL,
         fast_model_provider=FAST_MODEL_PROVIDER,
         fast_model=FAST_MODEL,
+        router_model_provider=ROUTER_MODEL_PROVIDER,
+        router_model=ROUTER_MODEL,
     )
 
 
@@ -147,6 +162,7 @@ def get_base_url(model: Union[OpenAIChatCompletionsModel, OpenAIResponsesModel])
     return str(model._client._base_url)
 
 
+@lru_cache(maxsize=64)
 def model_supports_structured_output(model: Union[OpenAIChatCompletionsModel, OpenAIResponsesModel]) -> bool:
     """Utility function to check if a model supports structured output"""
     structured_output_providers = ["openai.com", "anthropic.com"]
@@ -0,0 +1,141 @@
+"""
+Optional on-disk cache for LLM agent responses.
+
+Agents in the research workflow are sometimes re-run with identical prompts
+(e.g. debug reruns, retries, or partial re-execution after a failure), and each
+re-run pays a full LLM round-trip. This module provides a cached_run wrapper
+around ResearchRunner.run that hashes the (model, instructions, user message,
+output schema) tuple and stores the final output on disk, so repeat calls with
+the same inputs skip the network call entirely.
+
+The cache is opt-in: set the DEEP_RESEARCH_CACHE environment variable to "1"
+to enable it, and optionally DEEP_RESEARCH_CACHE_DIR to control where the
+cached responses are stored (defaults to .deep_research_cache in the working
+directory).
+
+The module also provides checkpointed_run, a variant aimed at crash recovery:
+setting DEEP_RESEARCH_CHECKPOINT_DIR persists each structured agent output to
+that directory keyed by agent name and message hash, so a restarted run
+rehydrates completed steps from disk instead of re-paying the LLM calls.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from typing import Optional, Type
+
+from pydantic import BaseModel
+
+from ..agents.baseclass import ResearchAgent, ResearchRunner
+from .os import get_env_with_prefix
+
+
+def is_cache_enabled() -> bool:
+    """Check whether the on-disk LLM response cache has been switched on"""
+    return get_env_with_prefix("DEEP_RESEARCH_CACHE") == "1"
+
+
+def _cache_dir() -> str:
+    cache_dir = get_env_with_prefix("DEEP_RESEARCH_CACHE_DIR", default=".deep_research_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def _cache_key(agent: ResearchAgent, user_message: str) -> str:
+    """Compute a content key from everything that determines the agent's response"""
+    model_name = str(getattr(agent.model, "model", agent.model))
+    schema_name = agent.output_type.__name__ if agent.output_type else ""
+    payload = "\x1e".join([model_name, str(agent.instructions), user_message, schema_name])
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _read_cached_output(path: str, output_type: Optional[Type[BaseModel]]):
+    with open(path, "r", encoding="utf-8") as f:
+        stored = f.read()
+    if output_type:
+        return output_type.model_validate_json(stored)
+    return json.loads(stored)
+
+
+def _write_cached_output(path: str, output) -> None:
+    serialized = output.model_dump_json() if isinstance(output, BaseModel) else json.dumps(output)
+    # Write to a temporary file and rename so a crash can't leave a partial entry
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(serialized)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+async def cached_run(
+    agent: ResearchAgent,
+    user_message: str,
+    output_type: Optional[Type[BaseModel]] = None,
+):
+    """
+    Run the agent and return its final output, serving repeat calls from the
+    on-disk cache when DEEP_RESEARCH_CACHE is enabled.
+
+    If output_type is provided, the output is returned (and rehydrated on a
+    cache hit) as that Pydantic model; otherwise it is returned as a string.
+    """
+    if not is_cache_enabled():
+        result = await ResearchRunner.run(agent, user_message)
+        return result.final_output_as(output_type) if output_type else result.final_output
+
+    path = os.path.join(_cache_dir(), f"{_cache_key(agent, user_message)}.json")
+    if os.path.exists(path):
+        return _read_cached_output(path, output_type)
+
+    result = await ResearchRunner.run(agent, user_message)
+    output = result.final_output_as(output_type) if output_type else result.final_output
+    _write_cached_output(path, output)
+    return output
+
+
+def _checkpoint_dir() -> Optional[str]:
+    """Return the checkpoint directory, or None if checkpointing is disabled"""
+    checkpoint_dir = get_env_with_prefix("DEEP_RESEARCH_CHECKPOINT_DIR")
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+    return checkpoint_dir
+
+
+def _read_checkpoint(path: str, output_type: Optional[Type[BaseModel]]):
+    with open(path, "r", encoding="utf-8") as f:
+        stored = f.read()
+    if output_type:
+        return output_type.model_validate_json(stored)
+    return json.loads(stored)
+
+
+async def checkpointed_run(
+    agent: ResearchAgent,
+    user_message: str,
+    output_type: Optional[Type[BaseModel]] = None,
+):
+    """
+    Run the agent and persist its final output as a checkpoint, so a crashed
+    run can be restarted and resume from the completed steps without
+    re-calling the LLM.
+
+    Checkpointing is enabled by setting DEEP_RESEARCH_CHECKPOINT_DIR to the
+    directory where the checkpoints should be stored. Checkpoints are keyed by
+    agent name and message hash, and the response cache (if enabled) still
+    applies underneath.
+    """
+    checkpoint_dir = _checkpoint_dir()
+    if not checkpoint_dir:
+        return await cached_run(agent, user_message, output_type)
+
+    path = os.path.join(checkpoint_dir, f"{agent.name}-{_cache_key(agent, user_message)}.json")
+    if os.path.exists(path):
+        return _read_checkpoint(path, output_type)
+
+    output = await cached_run(agent, user_message, output_type)
+    _write_cached_output(path, output)
+    return output
@@ -0,0 +1,58 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class _Section(BaseModel):
+    title: str = Field(description="The title of the section")
+    key_question: str = Field(description="The key question to be addressed in the section")
+
+
+class _Plan(BaseModel):
+    article_title: str = Field(description="The title of the article")
+    sections: List[_Section] = Field(description="List of sections that need to be written")
+    lead_section: Optional[_Section] = Field(description="The section to open with, if chosen", default=None)
+    notes_by_section: Dict[str, _Section] = Field(description="Notes keyed by section title", default_factory=dict)
+
+
+def test_create_type_parser_validates_nested_models():
+    from deep_researcher.agents.utils.parse_output import create_type_parser
+
+    parser = create_type_parser(_Plan)
+    plan = parser('{"article_title": "T", "sections": [{"title": "S1", "key_question": "Q1"}]}')
+
+    assert isinstance(plan, _Plan)
+    assert isinstance(plan.sections[0], _Section)
+    assert plan.sections[0].title == "S1"
+
+
+def test_create_type_parser_trust_schema_constructs_nested_models():
+    from deep_researcher.agents.utils.parse_output import create_type_parser
+
+    parser = create_type_parser(_Plan, trust_schema=True)
+    plan = parser(
+        '{"article_title": "T",'
+        ' "sections": [{"title": "S1", "key_question": "Q1"}, {"title": "S2", "key_question": "Q2"}],'
+        ' "lead_section": {"title": "S1", "key_question": "Q1"},'
+        ' "notes_by_section": {"S1": {"title": "S1", "key_question": "Q1"}}}'
+    )
+
+    assert isinstance(plan, _Plan)
+    assert all(isinstance(section, _Section) for section in plan.sections)
+    assert plan.sections[1].key_question == "Q2"
+    assert isinstance(plan.lead_section, _Section)
+    assert isinstance(plan.notes_by_section["S1"], _Section)
+
+
+def test_parse_json_output_coerces_common_mistakes():
+    from deep_researcher.agents.utils.parse_output import parse_json_output
+
+    # Fenced code block
+    assert parse_json_output('Here it is:\n```json\n{"a": 1}\n```') == {"a": 1}
+
+    # Comments and trailing commas, with string contents left untouched
+    assert parse_json_output('{"a": 1, // note\n "b": [1, 2,], /* block */ }') == {"a": 1, "b": [1, 2]}
+    assert parse_json_output('{"url": "https://example.com/a", }') == {"url": "https://example.com/a"}
+
+    # JSON embedded in surrounding prose
+    assert parse_json_output('Sure: {"a": 1} - let me know!') == {"a": 1}
@@ -63,22 +63,22 @@ def test_reformat_references():
     ]
     
     # Process each section in sequence
-    all_references = []
+    report_ref_map = {}
 
     # Process the first section
-    section_markdown_1, all_references = reformat_references(section_markdown_1, references_1, all_references)
+    section_markdown_1 = reformat_references(section_markdown_1, references_1, report_ref_map)
     draft += section_markdown_1 + "\n\n"
-    
+
     # Process the second section
-    section_markdown_2, all_references = reformat_references(section_markdown_2, references_2, all_references)
+    section_markdown_2 = reformat_references(section_markdown_2, references_2, report_ref_map)
     draft += section_markdown_2 + "\n\n"
-    
+
     # Process the third section
-    section_markdown_3, all_references = reformat_references(section_markdown_3, references_3, all_references)
+    section_markdown_3 = reformat_references(section_markdown_3, references_3, report_ref_map)
     draft += section_markdown_3 + "\n\n"
 
     # Produce the final report
-    final_report = draft + "## References:\n\n" + "\n".join(all_references)
+    final_report = draft + "## References:\n\n" + "\n".join(f"[{ref_num}] {url}" for url, ref_num in report_ref_map.items())
 
     expected_final_report = cleandoc(
         """# Research Report
@@ -21,7 +21,7 @@ from deep_researcher.agents.planner_agent import init_planner_agent, ReportPlan
 from deep_researcher.agents.proofreader_agent import init_proofreader_agent, ReportDraft, ReportDraftSection
 from deep_researcher.agents.writer_agent import init_writer_agent
 from deep_researcher.agents.thinking_agent import init_thinking_agent
-from deep_researcher.agents.tool_selector_agent import init_tool_selector_agent, AgentSelectionPlan, AgentTask
+from deep_researcher.agents.tool_selector_agent import init_tool_selector_agent, to_agent_selection_plan, AgentSelectionPlan, AgentTask
 
 # Configuration for LLMs
 config = LLMConfig(
@@ -203,7 +203,8 @@ async def test_tool_selector_agent():
     HISTORY OF ACTIONS, FINDINGS AND THOUGHTS: No research has been carried out yet.
     """
     result = await ResearchRunner.run(agent, user_input)
-    agent_output = result.final_output_as(AgentSelectionPlan)
+    # The agent responds in a minified wire format; expand it back to the full plan
+    agent_output = to_agent_selection_plan(result.final_output)
 
     assert isinstance(agent_output, AgentSelectionPlan), "The ToolSelectorAgent is not correctly formatting its output as an AgentSelectionPlan"
     assert len(agent_output.tasks) > 0, "The ToolSelectorAgent is not producing any tasks"